@@ -1,4 +1,10 @@
-from alphalab.alpha import Alpha
+__all__ = ["Alpha", "returns_ndarray"]
 
-__all__ = ["Alpha"]
 
+def __getattr__(name):
+    # Alpha pulls in pandas, so only import it when someone actually asks -
+    # that way `import alphalab.diagnostics` stays NumPy-only
+    if name in __all__:
+        from alphalab import alpha
+        return getattr(alpha, name)
+    raise AttributeError(f"module 'alphalab' has no attribute {name!r}")
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict
 from alphalab.alpha import Alpha
 
+__all__ = ["BaseAdapter"]
+
 
 class BaseAdapter(ABC):
     """Base class for connecting to different backtesting engines.
@@ -10,8 +12,13 @@ class BaseAdapter(ABC):
     etc.) all have different APIs. This adapter pattern lets us plug any of them
     into AlphaLab without changing the core code. Just inherit from this class
     and implement run_alpha() for whatever platform you're using.
+    
+    Instances carry no __dict__ from this base; if your adapter keeps state
+    (an engine handle, config, etc.) declare it with __slots__ on your class.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def run_alpha(self, alpha: Alpha) -> Dict[str, Any]:
         """Run an alpha through your backtesting engine.
@@ -1,29 +1,116 @@
-from typing import Callable, Dict, List, Any, Optional
+import pickle
+import string
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from types import FunctionType, MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
 
+# Tickers are 1-12 characters of A-Z, 0-9, '.', '_' or '-' (e.g. BRK.B, BTC-USD).
+# Checked with str.translate: deleting every allowed character from a valid
+# ticker leaves nothing behind, which is much quicker than a regex per ticker
+_TICKER_MAX_LEN = 12
+_TICKER_STRIP = str.maketrans('', '', string.ascii_uppercase + string.digits + '._-')
+
+
+def _invalid_tickers(universe: Sequence[str]) -> List[str]:
+    """Return the entries of universe that don't look like tickers."""
+    return [
+        ticker for ticker in universe
+        if not isinstance(ticker, str)
+        or not 0 < len(ticker) <= _TICKER_MAX_LEN
+        or ticker.translate(_TICKER_STRIP)
+    ]
+
+
+def returns_ndarray(signal_fn: Callable[[List[str]], Any]) -> Callable[[List[str]], Any]:
+    """Mark a signal function as returning an array in universe order.
+    
+    By default Alpha expects your signal function to give back a dict. If your
+    signals come out of NumPy anyway, decorate the function with this and just
+    return the array - the values get lined up with the universe by position,
+    so no dict ever has to be built.
+    
+    Example:
+        >>> @returns_ndarray
+        ... def momentum(universe):
+        ...     return prices[universe].pct_change(20).iloc[-1].to_numpy()
+    """
+    signal_fn.returns_ndarray = True
+    return signal_fn
+
+
+def _load_probe(payload: bytes) -> None:
+    """Unpickle a signal function inside a worker, just to see whether it loads."""
+    pickle.loads(payload)
+
+
+def _run_one(signal_fn: Callable[[List[str]], Any], universe: List[str]) -> pd.DataFrame:
+    """Run a signal function on one universe. Lives at module level so it can be pickled."""
+    if len(universe) == 0:
+        raise ValueError("Universe must be provided")
+    
+    return Alpha._to_frame(
+        signal_fn(universe),
+        universe,
+        positional=getattr(signal_fn, 'returns_ndarray', False)
+    )
+
+
 class Alpha:
     """A trading strategy that generates signals for assets.
     
     This is the main class you'll use to create and run alpha strategies.
     Just give it a name, a function that generates signals, and optionally
     a universe of assets to trade.
+    
+    Alpha uses __slots__ to stay small when you create thousands of them in a
+    parameter sweep. If you subclass it and want extra attributes, declare
+    them in your own __slots__.
     """
     
+    __slots__ = (
+        'name',
+        'signal_fn',
+        'universe',
+        '_universe_key',
+        '_universe_index',
+        '_metadata',
+        '_validate_universe',
+        '_cache',
+        '_index_cache',
+        '__weakref__'
+    )
+    
+    # How many (signal_fn, universe) results run() keeps around before
+    # throwing out the least recently used one
+    _CACHE_MAXSIZE = 128
+    
     def __init__(
         self,
         name: str,
         signal_fn: Callable[[List[str]], Dict[str, float]],
-        universe: Optional[List[str]] = None
+        universe: Optional[List[str]] = None,
+        validate_universe: bool = False
     ):
         """Create a new alpha strategy.
         
         Args:
             name: What you want to call this strategy
             signal_fn: Your signal function - takes a list of tickers, returns a dict
-                with ticker -> signal value pairs
+                with ticker -> signal value pairs. A pandas Series indexed by ticker
+                or a numpy array in universe order works too - see returns_ndarray.
             universe: Optional list of assets. If you don't set it here, you can
                 pass it later when you call run()
+            validate_universe: If True, check every ticker in the universe right
+                away (1-12 characters of A-Z, 0-9, '.', '_' or '-'), and again
+                whenever set_universe() is called. run() never pays for it.
+        
+        Raises:
+            ValueError: If validate_universe is on and some tickers look wrong
         """
         self.name = name
         self.signal_fn = signal_fn
@@ -31,11 +118,60 @@ class Alpha:
         # If no universe was provided, start with an empty list
         # The user will need to pass one to run() later
         if universe is None:
-            self.universe = []
+            universe = []
+        
+        # Remembered so set_universe() keeps checking later universes too
+        self._validate_universe = validate_universe
+        self.set_universe(universe)
+        
+        # Results from previous run() calls, most recently used last
+        # Values hold on to the signal function too, so its id (part of the
+        # key) can't be reused by a different function while the entry lives
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[Callable, pd.DataFrame]]" = OrderedDict()
+        
+        # Prebuilt 'asset' indexes per universe - an Index is immutable, so the
+        # same one can back every DataFrame built for that universe
+        self._index_cache: "OrderedDict[Tuple[str, ...], pd.Index]" = OrderedDict()
+    
+    def set_universe(self, universe: Optional[List[str]]) -> None:
+        """Swap in a new default universe.
+        
+        Assigning alpha.universe directly works too, but this also rebuilds the
+        prebuilt index and metadata right away instead of on the next call.
+        
+        Args:
+            universe: The new list of assets (None means an empty universe)
+        
+        Raises:
+            ValueError: If this Alpha was created with validate_universe=True
+                and some tickers look wrong
+        """
+        # Same as __init__ - no universe just means an empty one
+        if universe is None:
+            universe = []
+        
+        if self._validate_universe:
+            bad_tickers = _invalid_tickers(universe)
+            if bad_tickers:
+                raise ValueError(f"Invalid tickers in universe: {bad_tickers}")
+        
+        # Build the 'asset' index for the default universe once, up front -
+        # run() with no override reuses it as long as the universe is unchanged
+        universe_key = tuple(universe)
+        if len(universe_key) > 0:
+            universe_index = pd.Index(universe_key, name='asset')
         else:
-            self.universe = universe
+            universe_index = None
+        metadata = self._build_metadata(self.name, universe)
+        
+        # Everything that can fail is done - swap it all in together so a bad
+        # universe never leaves us half-updated
+        self.universe = universe
+        self._universe_key = universe_key
+        self._universe_index = universe_index
+        self._metadata = metadata
     
-    def run(self, universe: Optional[List[str]] = None) -> pd.DataFrame:
+    def run(self, universe: Optional[List[str]] = None, cache: bool = True) -> pd.DataFrame:
         """Run the alpha and get back signals as a DataFrame.
         
         This is where the magic happens - it calls your signal function for
@@ -46,6 +182,13 @@ class Alpha:
             universe: Optional - if you pass this, it uses this instead of
                 the one you set when creating the Alpha. Useful for testing
                 different universes without creating a new Alpha object.
+            cache: If True (the default), reuse the result from an earlier call
+                with the same signal function and universe instead of calling
+                the signal function again. Only plain functions get cached -
+                callable objects, partials and bound methods can carry state,
+                so they always run. Set to False if your signal function isn't
+                deterministic (e.g. it pulls live data), and call clear_cache()
+                if you change state it depends on (globals, closed-over objects).
         
         Returns:
             A DataFrame with tickers as the index and signal values in a
@@ -65,37 +208,226 @@ class Alpha:
         if len(assets_to_process) == 0:
             raise ValueError("Universe must be provided")
         
-        # Run the signal function - this gives us a dict of {ticker: signal_value}
-        signals_by_asset = self.signal_fn(assets_to_process)
+        # Callable objects (a @dataclass with a __call__, a partial, a bound
+        # method) can change their own state between calls without changing
+        # identity, so caching them would hand back stale signals
+        cache = cache and isinstance(self.signal_fn, FunctionType)
+        
+        # Keyed on id(signal_fn) - a replaced signal_fn gets a different id
+        assets_key = tuple(assets_to_process)
+        key = (id(self.signal_fn), assets_key)
+        if cache and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key][1].copy()
         
-        # Convert to DataFrame - much easier to work with than a dict
-        # Setting orient = 'index' makes the tickers the row index, which is what we want
-        result_df = pd.DataFrame.from_dict(
+        # Run the signal function - this usually gives us a dict of {ticker: signal_value}
+        signals_by_asset = self.signal_fn(assets_to_process)
+        result_df = self._to_frame(
             signals_by_asset,
-            orient = 'index',
-            columns = ['signal']
+            assets_key,
+            self._index_for(assets_key),
+            positional=getattr(self.signal_fn, 'returns_ndarray', False)
         )
         
-        # Give the index a nice name
-        result_df.index.name = 'asset'
+        if cache:
+            # Store our own copy so callers can't mutate what's in the cache
+            self._cache[key] = (self.signal_fn, result_df.copy())
+            if len(self._cache) > self._CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
         
         return result_df
     
-    def metadata(self) -> Dict[str, Any]:
+    def clear_cache(self) -> None:
+        """Forget every result that run() has cached so far."""
+        self._cache.clear()
+        self._index_cache.clear()
+    
+    def __copy__(self) -> "Alpha":
+        """Shallow copy that gets its own (empty) caches instead of sharing ours."""
+        cls = type(self)
+        clone = cls.__new__(cls)
+        
+        # Copy every slot up the class chain (subclasses may add their own)
+        for klass in cls.__mro__:
+            slots = getattr(klass, '__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if slot not in ('__dict__', '__weakref__') and hasattr(self, slot):
+                    setattr(clone, slot, getattr(self, slot))
+        if hasattr(self, '__dict__'):
+            clone.__dict__.update(self.__dict__)
+        
+        clone._cache = OrderedDict()
+        clone._index_cache = OrderedDict()
+        return clone
+    
+    def _index_for(self, assets_key: Tuple[str, ...]) -> pd.Index:
+        """Get the 'asset' index for a universe, building it only the first time.
+        
+        Callers get a view - it shares the data but not the name, so someone
+        renaming their result's index can't change the one we keep around.
+        """
+        # Common case: the universe we were created with (still unchanged)
+        if self._universe_index is not None and assets_key == self._universe_key:
+            return self._universe_index.view()
+        
+        index = self._index_cache.get(assets_key)
+        if index is None:
+            index = pd.Index(assets_key, name='asset')
+            self._index_cache[assets_key] = index
+            if len(self._index_cache) > self._CACHE_MAXSIZE:
+                self._index_cache.popitem(last=False)
+        else:
+            self._index_cache.move_to_end(assets_key)
+        
+        return index.view()
+    
+    def run_many(
+        self,
+        universes: List[List[str]],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> List[pd.DataFrame]:
+        """Run the alpha over several universes in parallel.
+        
+        Instead of looping over run() yourself, hand over all the universes at
+        once and they get spread across a pool of workers. Processes are used
+        by default; if your signal function can't be pickled (lambdas, nested
+        functions) or the worker processes can't load it (functions defined in
+        __main__ or a notebook under the spawn start method), it quietly falls
+        back to threads, which still help when the signal function spends its
+        time inside NumPy. Errors raised by the signal function itself are
+        passed straight through.
+        
+        Results don't go through run()'s cache - each universe is computed fresh.
+        
+        Args:
+            universes: A list of universes (each one a list of tickers)
+            max_workers: How many workers to use. None lets concurrent.futures pick.
+            use_processes: Set to False to always use threads
+        
+        Returns:
+            One signals DataFrame per universe, in the same order you passed them in
+        
+        Raises:
+            ValueError: If any of the universes is empty
+        """
+        # We may need to go over the universes twice (see the fallback below)
+        universes = list(universes)
+        
+        # Catch empty universes up front instead of inside some worker
+        for universe in universes:
+            if len(universe) == 0:
+                raise ValueError("Universe must be provided")
+        
+        worker = partial(_run_one, self.signal_fn)
+        
+        # Processes need to pickle the signal function - check before spinning any up
+        if use_processes:
+            try:
+                payload = pickle.dumps(self.signal_fn)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                use_processes = False
+        
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                # Some functions pickle fine here but can't be loaded in the worker -
+                # e.g. ones defined in __main__ or a notebook under the spawn start
+                # method (the default on macOS and Windows). Probe that once before
+                # running anything, so a failure inside signal_fn itself is never
+                # mistaken for it (and never makes us run everything twice)
+                try:
+                    pool.submit(_load_probe, payload).result()
+                except Exception:
+                    use_processes = False
+                else:
+                    return list(pool.map(worker, universes))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(worker, universes))
+    
+    @staticmethod
+    def _to_frame(
+        signals_by_asset: Any,
+        assets: Sequence[str],
+        index: Optional[pd.Index] = None,
+        positional: bool = False
+    ) -> pd.DataFrame:
+        """Turn whatever the signal function gave back into the 'signal' DataFrame.
+        
+        If you already have an 'asset' index for the universe, pass it as index
+        and it gets reused instead of building a new one. positional=True (set
+        by @returns_ndarray) skips the type checks and treats the result as an
+        array in universe order.
+        """
+        # A bare array lines up position-by-position with the universe
+        if positional or isinstance(signals_by_asset, np.ndarray):
+            keys = assets if index is None else index
+            values = np.ascontiguousarray(signals_by_asset, dtype=np.float64)
+            
+            # pandas would happily broadcast a scalar or length-1 array to
+            # every ticker - insist on exactly one value per asset instead
+            if values.shape != (len(assets),):
+                raise ValueError(
+                    f"signal_fn returned {values.shape} values for {len(assets)} assets"
+                )
+        
+        # Already a Series - keep its tickers, just make sure the values are floats
+        elif isinstance(signals_by_asset, pd.Series):
+            keys = signals_by_asset.index
+            values = signals_by_asset.to_numpy(dtype=np.float64)
+        
+        # The normal dict case - pull the values straight into a float64 array
+        # so pandas doesn't have to build object arrays and guess the dtype
+        else:
+            keys = list(signals_by_asset)
+            values = np.fromiter(
+                (signals_by_asset[key] for key in keys),
+                dtype=np.float64,
+                count=len(keys)
+            )
+            
+            # Usually the dict comes back in universe order - reuse the index if so
+            if index is not None and tuple(keys) == tuple(assets):
+                keys = index
+        
+        if not isinstance(keys, pd.Index) or keys.name != 'asset':
+            keys = pd.Index(keys, name='asset')
+        
+        return pd.DataFrame({'signal': values}, index=keys, copy=False)
+    
+    def metadata(self) -> Mapping[str, Any]:
         """Get some basic info about this strategy.
         
-        Just returns a dict with the name, how many assets are in the universe,
-        and whether a universe was actually set. Handy for debugging or logging.
+        Just returns the name, how many assets are in the universe, and whether
+        a universe was actually set. Handy for debugging or logging. The dict is
+        built once and reused, so you get a read-only view of it back - wrap it
+        in dict() if you want to change it.
         
         Returns:
-            Dict with 'name', 'universe_size', and 'has_universe' keys
+            Read-only mapping with 'name', 'universe_size', and 'has_universe' keys
+        """
+        # Only rebuild if the name or universe size changed since last time -
+        # both are O(1) to check, and they're all the metadata depends on
+        metadata = self._metadata
+        if metadata["name"] is not self.name or metadata["universe_size"] != len(self.universe):
+            metadata = self._metadata = self._build_metadata(self.name, self.universe)
+        
+        return MappingProxyType(metadata)
+    
+    @staticmethod
+    def _build_metadata(name: str, universe: Sequence[str]) -> Dict[str, Any]:
+        """Build the dict that metadata() hands out a read-only view of.
+        
+        Kept as a plain dict (not a MappingProxyType) so Alpha still pickles.
         """
         # Check if we have a universe set (might be empty)
-        has_universe_set = len(self.universe) > 0
+        has_universe_set = len(universe) > 0
         
         return {
-            "name": self.name,
-            "universe_size": len(self.universe),
+            "name": name,
+            "universe_size": len(universe),
             "has_universe": has_universe_set
         }
 
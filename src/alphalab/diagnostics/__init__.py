@@ -1,4 +1,13 @@
-from alphalab.diagnostics.ic import information_coefficient, sharpe_ratio
-
-__all__ = ["information_coefficient", "sharpe_ratio"]
+from alphalab.diagnostics.ic import (
+    information_coefficient,
+    information_coefficient_batch,
+    sharpe_ratio,
+    sharpe_ratio_batch,
+)
 
+__all__ = [
+    "information_coefficient",
+    "information_coefficient_batch",
+    "sharpe_ratio",
+    "sharpe_ratio_batch",
+]
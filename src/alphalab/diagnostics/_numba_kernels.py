@@ -0,0 +1,117 @@
+"""Compiled kernels for diagnostics/ic.py.
+
+Importing this module imports numba, which is slow and optional - ic.py only
+loads it the first time a compiled kernel is needed, and falls back to NumPy
+if the import fails.
+"""
+
+from numba import njit, prange
+import numpy as np
+
+
+@njit(nogil = True, cache = True)
+def pearson_corr(x, y):
+    """Single-pass Pearson correlation of x and y (compiled with numba).
+    
+    Uses Welford-style running means and co-moments so it stays accurate
+    without a separate pass to compute the means. Pairs where either side
+    is NaN/inf are skipped inside the same loop.
+    """
+    n = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for i in range(x.shape[0]):
+        xi = x[i]
+        yi = y[i]
+        if not (np.isfinite(xi) and np.isfinite(yi)):
+            continue
+    
+        n += 1
+        dx = xi - mean_x
+        mean_x += dx / n
+        dy = yi - mean_y
+        mean_y += dy / n
+        sxx += dx * (xi - mean_x)
+        syy += dy * (yi - mean_y)
+        sxy += dx * (yi - mean_y)
+    
+    # Need at least two points, and some variance on both sides
+    if n < 2:
+        return 0.0
+    denominator = np.sqrt(sxx * syy)
+    if denominator == 0:
+        return 0.0
+    return sxy / denominator
+
+# fastmath minus the no-NaN/no-inf assumptions: reassociation and FMA
+# contraction let LLVM vectorize the reductions (AVX2/AVX-512 on CPUs
+# that have them), while the isfinite check below still means something
+@njit(nogil = True, cache = True, fastmath = {'reassoc', 'contract', 'nsz', 'arcp'})
+def pearson_corr_simd(x, y):
+    """Two-pass Pearson correlation laid out for SIMD (compiled with numba).
+    
+    First pass gets the means, second pass accumulates the centered
+    co-moments. Both are plain reductions the compiler can vectorize.
+    Falls back to pearson_corr if there are any NaN/inf values.
+    """
+    n = x.shape[0]
+    sx = 0.0
+    sy = 0.0
+    for i in range(n):
+        sx += x[i]
+        sy += y[i]
+    
+    if not (np.isfinite(sx) and np.isfinite(sy)):
+        return pearson_corr(x, y)
+    
+    mean_x = sx / n
+    mean_y = sy / n
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for i in range(n):
+        dx = x[i] - mean_x
+        dy = y[i] - mean_y
+        sxx += dx * dx
+        syy += dy * dy
+        sxy += dx * dy
+    
+    denominator = np.sqrt(sxx * syy)
+    if denominator == 0:
+        return 0.0
+    return sxy / denominator
+
+
+@njit(parallel = True, fastmath = True, cache = True)
+def ic_batch(S, r):
+    """Pearson correlation of every column of S against r (compiled with numba)."""
+    n, k = S.shape
+    
+    # The returns side is shared by every column, so center it once up front
+    rd = r - r.mean()
+    rd_ss = 0.0
+    for i in range(n):
+        rd_ss += rd[i] * rd[i]
+    
+    out = np.zeros(k)
+    for j in prange(k):
+        col_mean = 0.0
+        for i in range(n):
+            col_mean += S[i, j]
+        col_mean /= n
+    
+        # One fused pass for the cross product and the column's own sum of squares
+        cross = 0.0
+        col_ss = 0.0
+        for i in range(n):
+            d = S[i, j] - col_mean
+            cross += d * rd[i]
+            col_ss += d * d
+    
+        denominator = np.sqrt(col_ss * rd_ss)
+        if denominator > 0:
+            out[j] = cross / denominator
+    return out
@@ -1,7 +1,60 @@
-from typing import Union
-import pandas as pd
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Union
 import numpy as np
 
+# pandas is only needed for type hints here - everything below runs on plain
+# ndarrays (Series/DataFrames get converted with np.ascontiguousarray)
+if TYPE_CHECKING:
+    import pandas as pd
+
+# numba is optional and about as slow to import as pandas, so the compiled
+# kernels live in _numba_kernels and only get loaded the first time one is
+# needed. None means we haven't tried yet, False means numba isn't installed
+_kernels = None
+
+
+def _numba_kernels():
+    """Load the compiled kernels on first use. Returns None if numba is missing."""
+    global _kernels
+    if _kernels is None:
+        try:
+            from alphalab.diagnostics import _numba_kernels as kernels
+        except ImportError:
+            kernels = False
+        _kernels = kernels
+    return _kernels or None
+
+
+# Below this many points the vectorized kernel's second pass isn't worth it
+_SIMD_MIN_SIZE = 256
+
+
+def _pearson_corr_numpy(s: np.ndarray, r: np.ndarray) -> float:
+    """Plain NumPy Pearson correlation, for when numba isn't installed."""
+    # Drop any pairs where either side is NaN/inf - one mask, one indexing pass
+    mask = np.isfinite(s) & np.isfinite(r)
+    if not mask.all():
+        s = s[mask]
+        r = r[mask]
+    
+    # Need at least two points for a correlation to mean anything
+    if s.size < 2:
+        return 0.0
+    
+    # Pearson correlation as centered dot products
+    sd = s - s.mean()
+    rd = r - r.mean()
+    numerator = sd @ rd
+    denominator = np.sqrt((sd @ sd) * (rd @ rd))
+    
+    # Edge case: if everything is the same value, correlation is undefined
+    # Just return 0 in that case since there's no predictive power
+    if denominator == 0:
+        return 0.0
+    
+    return float(numerator / denominator)
+
 
 def information_coefficient(
     signals: Union[pd.Series, np.ndarray],
@@ -15,7 +68,9 @@ def information_coefficient(
     
     Args:
         signals: Your predicted signals - can be Series or numpy array, doesn't matter
-        returns: What actually happened - must be the same length as signals
+        returns: What actually happened - must be the same length as signals. If
+            both are Series they get matched up by index label (ticker), otherwise
+            by position
     
     Returns:
         The IC value (float between -1 and 1). Returns 0.0 if correlation can't be
@@ -32,26 +87,118 @@ def information_coefficient(
         >>> print(f"IC: {ic:.3f}")
         IC: 0.995
     """
-    # Convert numpy arrays to Series if needed - easier to work with Series
-    if isinstance(signals, np.ndarray):
-        signals = pd.Series(signals)
-    
-    if isinstance(returns, np.ndarray):
-        returns = pd.Series(returns)
-    
     # Can't compute correlation if lengths don't match
     if len(signals) != len(returns):
         raise ValueError("signals and returns must have the same length")
     
-    # Calculate correlation - this is the IC
-    ic_value = signals.corr(returns)
+    # Two Series get matched up by ticker (like Series.corr does), not by
+    # position - only worth doing when the indexes actually differ
+    if (
+        hasattr(signals, 'index')
+        and hasattr(returns, 'index')
+        and not signals.index.equals(returns.index)
+    ):
+        signals, returns = signals.align(returns, join='inner')
     
-    # Edge case: if everything is the same value, correlation is NaN
-    # Just return 0 in that case since there's no predictive power
-    if pd.isna(ic_value):
-        return 0.0
+    # Work on plain float64 buffers - skips building Series objects entirely
+    s = np.ascontiguousarray(signals, dtype=np.float64)
+    r = np.ascontiguousarray(returns, dtype=np.float64)
+    
+    if s.shape != r.shape:
+        raise ValueError("signals and returns must have the same length")
+    
+    # Compiled kernels if we have numba (vectorized one for longer inputs),
+    # multi-pass NumPy otherwise
+    kernels = _numba_kernels()
+    if kernels is not None and s.ndim == 1:
+        if s.size >= _SIMD_MIN_SIZE:
+            return float(kernels.pearson_corr_simd(s, r))
+        return float(kernels.pearson_corr(s, r))
     
-    return float(ic_value)
+    return _pearson_corr_numpy(s, r)
+
+
+def _ic_batch_numpy(S: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Plain NumPy batch IC, for when numba isn't installed."""
+    rd = r - r.mean()
+    Sd = S - S.mean(axis = 0)
+    norms = np.sqrt((Sd * Sd).sum(axis = 0) * (rd @ rd))
+    
+    out = np.zeros(S.shape[1])
+    np.divide(rd @ Sd, norms, out = out, where = norms > 0)
+    return out
+
+
+def information_coefficient_batch(
+    signals: Union[pd.DataFrame, np.ndarray],
+    returns: Union[pd.Series, np.ndarray]
+) -> np.ndarray:
+    """Calculate the IC of many signals against the same returns in one go.
+    
+    Same thing as calling information_coefficient() once per signal column, but
+    without the Python loop. If numba is installed the columns get spread across
+    all your cores, otherwise it falls back to a vectorized NumPy version.
+    
+    Args:
+        signals: 2D array (or DataFrame) shaped (n_periods, n_signals) - one
+            column per signal
+        returns: What actually happened - must have n_periods values
+    
+    Returns:
+        A numpy array with one IC per signal column. Columns with no variance
+        get 0.0, and NaN/inf pairs get skipped, same as information_coefficient().
+    
+    Raises:
+        ValueError: If signals isn't 2D or the row count doesn't match returns
+    
+    Example:
+        >>> import numpy as np
+        >>> signals = np.random.randn(250, 10)
+        >>> returns = np.random.randn(250)
+        >>> ics = information_coefficient_batch(signals, returns)
+        >>> ics.shape
+        (10,)
+    """
+    S = np.ascontiguousarray(signals, dtype=np.float64)
+    r = np.ascontiguousarray(returns, dtype=np.float64)
+    
+    if S.ndim != 2:
+        raise ValueError("signals must be 2D with one column per signal")
+    
+    if S.shape[0] != r.shape[0] or r.ndim != 1:
+        raise ValueError("signals and returns must have the same length")
+    
+    # The kernels assume finite inputs. A missing return drops that row for
+    # every signal; a missing signal only matters for its own column
+    finite_returns = np.isfinite(r)
+    if not finite_returns.all():
+        S = np.ascontiguousarray(S[finite_returns])
+        r = r[finite_returns]
+    
+    # Nothing to correlate with fewer than two rows
+    if S.shape[0] < 2:
+        return np.zeros(S.shape[1])
+    
+    # Blank out columns with missing signals for the batch kernel - they get
+    # filled in properly below
+    bad_columns = np.flatnonzero(~np.isfinite(S).all(axis = 0))
+    S_clean = S
+    if bad_columns.size > 0:
+        S_clean = S.copy()
+        S_clean[:, bad_columns] = 0.0
+    
+    kernels = _numba_kernels()
+    if kernels is not None:
+        out = kernels.ic_batch(S_clean, r)
+    else:
+        out = _ic_batch_numpy(S_clean, r)
+    
+    # Columns with missing signals are rare - do those one at a time so their
+    # NaN pairs get dropped exactly like information_coefficient() would
+    for j in bad_columns:
+        out[j] = information_coefficient(S[:, j], r)
+    
+    return out
 
 
 def sharpe_ratio(
@@ -80,28 +227,93 @@ def sharpe_ratio(
         >>> sharpe = sharpe_ratio(returns, risk_free_rate = 0.02, periods_per_year = 252)
         >>> print(f"Sharpe: {sharpe:.3f}")
     """
-    # Convert numpy arrays to Series if needed
-    if isinstance(returns, np.ndarray):
-        returns = pd.Series(returns)
+    # Work on a plain float64 buffer - no Series, no pandas dispatch. A single
+    # series is just a one-column batch, so both functions share one formula
+    r = np.ascontiguousarray(returns, dtype=np.float64).reshape(-1, 1)
+    return float(_sharpe_columns(r, risk_free_rate, periods_per_year)[0])
+
+
+def sharpe_ratio_batch(
+    returns: Union[pd.DataFrame, np.ndarray],
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = 252
+) -> np.ndarray:
+    """Calculate Sharpe ratios for a whole bunch of strategies at once.
     
-    # Can't calculate anything with no data
-    if len(returns) == 0:
-        return 0.0
+    Same math as sharpe_ratio() (literally - they share the same code), but for
+    a 2D array with one column per strategy, done in a single vectorized pass
+    instead of a Python loop. Handy for parameter sweeps where you've got
+    hundreds of return streams to compare.
     
-    # Get the mean and standard deviation of returns
-    mean_return = returns.mean()
-    std_return = returns.std()
+    Args:
+        returns: 2D array (or DataFrame) shaped (n_periods, n_strategies)
+        risk_free_rate: Risk-free rate (default 0.0)
+        periods_per_year: How many periods make up a year (252 for daily, 12 for monthly, etc.)
     
-    # If there's no volatility, Sharpe is undefined - just return 0
-    if std_return == 0 or pd.isna(std_return):
-        return 0.0
+    Returns:
+        A numpy array with one annualized Sharpe ratio per column. Columns with
+        no volatility (or fewer than two values) get 0.0, same as sharpe_ratio().
     
-    # Calculate excess return (above risk-free rate)
-    # Need to adjust risk-free rate to match the period frequency
-    excess_return = mean_return - (risk_free_rate / periods_per_year)
+    Raises:
+        ValueError: If returns isn't 2D
     
-    # Annualize the Sharpe ratio by multiplying by sqrt of periods per year
-    sharpe = excess_return / std_return * np.sqrt(periods_per_year)
+    Example:
+        >>> import numpy as np
+        >>> returns = np.random.randn(252, 20) * 0.01
+        >>> sharpes = sharpe_ratio_batch(returns, risk_free_rate = 0.02)
+        >>> sharpes.shape
+        (20,)
+    """
+    R = np.ascontiguousarray(returns, dtype=np.float64)
     
-    return float(sharpe)
+    if R.ndim != 2:
+        raise ValueError("returns must be 2D with one column per strategy")
+    
+    return _sharpe_columns(R, risk_free_rate, periods_per_year)
+
 
+def _sharpe_columns(
+    R: np.ndarray,
+    risk_free_rate: float,
+    periods_per_year: int
+) -> np.ndarray:
+    """Annualized Sharpe ratio of every column of a 2D float64 array.
+    
+    This is the one place the Sharpe math lives - sharpe_ratio() and
+    sharpe_ratio_batch() both call it. NaN/inf values get skipped per column.
+    """
+    counts = np.full(R.shape[1], R.shape[0], dtype=np.float64)
+    total = R.sum(axis = 0)
+    finite = None
+    
+    # Missing values poison the sum - only then pay for filtering them out
+    if not np.isfinite(total).all():
+        finite = np.isfinite(R)
+        R = np.where(finite, R, 0.0)
+        total = R.sum(axis = 0)
+        counts = finite.sum(axis = 0).astype(np.float64)
+    
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        mean_return = total / counts
+        
+        # Corrected two-pass variance: center on the mean first (so offset
+        # data like 1.0 + tiny noise doesn't lose its precision), then take
+        # out whatever rounding error is left in the mean
+        deviations = R - mean_return
+        if finite is not None:
+            deviations = np.where(finite, deviations, 0.0)
+        dev_sum = deviations.sum(axis = 0)
+        centered_ss = np.einsum('ij,ij->j', deviations, deviations) - dev_sum * dev_sum / counts
+        std_return = np.sqrt(np.maximum(centered_ss, 0.0) / (counts - 1))
+    
+    # No volatility (within rounding of the mean) or too few points means
+    # Sharpe is undefined - those columns just get 0
+    eps = np.finfo(np.float64).eps
+    valid = (counts >= 2) & (std_return > counts * eps * np.abs(mean_return))
+    
+    excess_return = mean_return - (risk_free_rate / periods_per_year)
+    
+    out = np.zeros(R.shape[1])
+    np.divide(excess_return, std_return, out = out, where = valid)
+    out *= np.sqrt(periods_per_year)
+    return out
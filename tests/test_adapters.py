@@ -0,0 +1,40 @@
+"""Tests for the adapter base class - making sure custom adapters plug in."""
+
+import pytest
+from alphalab import Alpha
+from alphalab.adapters import BaseAdapter
+
+
+class DummyAdapter(BaseAdapter):
+    """Tiny adapter that just reports how many assets it was given."""
+    
+    __slots__ = ("engine",)
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def run_alpha(self, alpha):
+        return {"engine": self.engine, "n_assets": len(alpha.run())}
+
+
+def test_adapter_subclass():
+    """Test that an adapter inheriting from BaseAdapter works and is recognized."""
+    adapter = DummyAdapter(engine = "dummy")
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = lambda universe: {asset: 0.0 for asset in universe},
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    assert isinstance(adapter, BaseAdapter)
+    assert adapter.run_alpha(alpha) == {"engine": "dummy", "n_assets": 2}
+    assert not hasattr(adapter, "__dict__")
+
+
+def test_adapter_missing_run_alpha():
+    """Test that a subclass that forgets run_alpha() can't be created."""
+    class LazyAdapter(BaseAdapter):
+        pass
+    
+    with pytest.raises(TypeError):
+        LazyAdapter()
@@ -1,10 +1,25 @@
 """Tests for the Alpha class - making sure everything works as expected."""
 
+import os
 import pytest
+from dataclasses import dataclass
+from collections.abc import Mapping
 import pandas as pd
 from alphalab.alpha import Alpha
 
 
+def constant_signal_fn(universe):
+    """Module-level signal function so it can be pickled for process pools."""
+    return {asset: 1.0 for asset in universe}
+
+
+def failing_signal_fn(universe):
+    """Module-level signal function that logs each call to a file, then blows up."""
+    with open(os.environ["ALPHALAB_TEST_CALL_LOG"], "a") as log:
+        log.write(f"{os.getpid()}\n")
+    raise AttributeError("signal function bug")
+
+
 def test_alpha_basic():
     """Basic smoke test - can we create an Alpha and does it have the right stuff?"""
     # Make a simple signal function for testing - just returns zeros
@@ -30,9 +45,9 @@ def test_alpha_basic():
     result = alpha.run()
     assert isinstance(result, pd.DataFrame)
     
-    # Test that metadata() gives us back a dict
+    # Test that metadata() gives us back a (read-only) mapping
     metadata = alpha.metadata()
-    assert isinstance(metadata, dict)
+    assert isinstance(metadata, Mapping)
 
 
 def test_alpha_initialization():
@@ -131,3 +146,372 @@ def test_alpha_metadata():
     assert metadata["universe_size"] == 3
     assert metadata["has_universe"] is True
 
+
+
+def test_alpha_run_signal_fn_returns_array():
+    """Test that a signal function can hand back a numpy array in universe order."""
+    import numpy as np
+    
+    def array_signal_fn(universe):
+        return np.arange(len(universe), dtype = float)
+    
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = array_signal_fn,
+        universe = ["AAPL", "GOOGL", "MSFT"]
+    )
+    
+    signals_df = alpha.run()
+    assert signals_df.index.tolist() == ["AAPL", "GOOGL", "MSFT"]
+    assert signals_df.index.name == "asset"
+    assert signals_df["signal"].tolist() == [0.0, 1.0, 2.0]
+
+
+def test_alpha_run_signal_fn_returns_series():
+    """Test that a signal function can hand back a Series indexed by ticker."""
+    def series_signal_fn(universe):
+        return pd.Series({asset: 1 for asset in universe})
+    
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = series_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    signals_df = alpha.run()
+    assert signals_df.index.tolist() == ["AAPL", "GOOGL"]
+    assert signals_df["signal"].dtype == float
+
+
+def test_alpha_run_cache():
+    """Test that run() reuses results for the same universe unless told not to."""
+    calls = []
+    
+    def counting_signal_fn(universe):
+        calls.append(list(universe))
+        return {asset: 1.0 for asset in universe}
+    
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = counting_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    first = alpha.run()
+    first.loc["AAPL", "signal"] = 99.0  # mutating the result shouldn't touch the cache
+    second = alpha.run()
+    assert len(calls) == 1
+    assert second.loc["AAPL", "signal"] == 1.0
+    
+    # A different universe is a different cache entry
+    alpha.run(universe = ["MSFT"])
+    assert len(calls) == 2
+    
+    # Bypassing or clearing the cache calls the signal function again
+    alpha.run(cache = False)
+    assert len(calls) == 3
+    alpha.clear_cache()
+    alpha.run()
+    assert len(calls) == 4
+
+
+def test_alpha_run_many_processes():
+    """Test that run_many gives back one DataFrame per universe, in order."""
+    alpha = Alpha(name = "test_alpha", signal_fn = constant_signal_fn)
+    
+    universes = [["AAPL", "GOOGL"], ["MSFT"], ["TSLA", "NVDA", "AMZN"]]
+    results = alpha.run_many(universes, max_workers = 2)
+    
+    assert [df.index.tolist() for df in results] == universes
+    assert all((df["signal"] == 1.0).all() for df in results)
+
+
+def test_alpha_run_many_unpicklable_falls_back_to_threads():
+    """Test that run_many still works when the signal function can't be pickled."""
+    alpha = Alpha(name = "test_alpha", signal_fn = lambda universe: {a: 0.5 for a in universe})
+    
+    results = alpha.run_many([["AAPL"], ["MSFT", "TSLA"]], max_workers = 2)
+    
+    assert [df.index.tolist() for df in results] == [["AAPL"], ["MSFT", "TSLA"]]
+    assert results[1].loc["TSLA", "signal"] == 0.5
+
+
+def test_alpha_run_many_broken_process_pool_falls_back(monkeypatch):
+    """Test that run_many retries with threads if the worker processes can't load the function."""
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+    import alphalab.alpha as alpha_module
+    
+    class BrokenPool:
+        def __init__(self, max_workers = None):
+            pass
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc_info):
+            return False
+        
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker could not load the signal function"))
+            return future
+        
+        def map(self, fn, iterable):
+            raise AssertionError("should not run anything after a failed load probe")
+    
+    monkeypatch.setattr(alpha_module, "ProcessPoolExecutor", BrokenPool)
+    alpha = Alpha(name = "test_alpha", signal_fn = constant_signal_fn)
+    
+    results = alpha.run_many([["AAPL"], ["MSFT", "TSLA"]])
+    assert [df.index.tolist() for df in results] == [["AAPL"], ["MSFT", "TSLA"]]
+
+
+def test_alpha_run_many_signal_fn_error_propagates(tmp_path, monkeypatch):
+    """Test that an error inside signal_fn comes straight through, without a thread retry."""
+    import alphalab.alpha as alpha_module
+    
+    def no_threads(*args, **kwargs):
+        raise AssertionError("should not fall back to threads")
+    
+    call_log = tmp_path / "calls.txt"
+    monkeypatch.setenv("ALPHALAB_TEST_CALL_LOG", str(call_log))
+    monkeypatch.setattr(alpha_module, "ThreadPoolExecutor", no_threads)
+    alpha = Alpha(name = "test_alpha", signal_fn = failing_signal_fn)
+    
+    with pytest.raises(AttributeError, match="signal function bug"):
+        alpha.run_many([["AAPL"], ["MSFT"]], max_workers = 2)
+    
+    # Once per universe, and only ever in the worker processes
+    pids = call_log.read_text().split()
+    assert len(pids) == 2
+    assert str(os.getpid()) not in pids
+
+
+def test_alpha_run_many_empty_universe():
+    """Test that run_many rejects an empty universe like run() does."""
+    alpha = Alpha(name = "test_alpha", signal_fn = constant_signal_fn)
+    
+    with pytest.raises(ValueError, match="Universe must be provided"):
+        alpha.run_many([["AAPL"], []])
+
+
+def test_alpha_run_reuses_universe_index():
+    """Test that repeated runs on the same universe reuse the index without sharing it."""
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = constant_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    first = alpha.run(cache = False)
+    second = alpha.run(cache = False)
+    assert first.index.equals(second.index)
+    assert first.index.name == "asset"
+    
+    # Renaming one result's index mustn't leak into other results, whether it
+    # came from the default universe or an override
+    second.index.name = "ticker"
+    assert first.index.name == "asset"
+    assert alpha.run(cache = False).index.name == "asset"
+    
+    override_first = alpha.run(universe = ["MSFT", "TSLA"], cache = False)
+    override_first.index.name = "ticker"
+    assert alpha.run(universe = ["MSFT", "TSLA"], cache = False).index.name == "asset"
+    
+    # A dict in a different order than the universe gets its own index
+    alpha.signal_fn = lambda universe: {"GOOGL": 1.0, "AAPL": 2.0}
+    reordered = alpha.run(cache = False)
+    assert reordered.index.tolist() == ["GOOGL", "AAPL"]
+
+
+def test_alpha_uses_slots():
+    """Test that Alpha instances don't carry a per-instance __dict__."""
+    alpha = Alpha(name = "test_alpha", signal_fn = constant_signal_fn)
+    
+    assert not hasattr(alpha, "__dict__")
+    with pytest.raises(AttributeError):
+        alpha.not_an_attribute = 1
+    
+    # Weak references still work, same as before __slots__
+    import weakref
+    assert weakref.ref(alpha)() is alpha
+
+
+def test_alpha_run_returns_ndarray_decorator():
+    """Test that @returns_ndarray lines array-like results up with the universe."""
+    from alphalab import returns_ndarray
+    
+    @returns_ndarray
+    def list_signal_fn(universe):
+        return [float(i) for i in range(len(universe))]
+    
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = list_signal_fn,
+        universe = ["AAPL", "GOOGL", "MSFT"]
+    )
+    
+    signals_df = alpha.run()
+    assert list_signal_fn.returns_ndarray is True
+    assert signals_df.index.tolist() == ["AAPL", "GOOGL", "MSFT"]
+    assert signals_df["signal"].tolist() == [0.0, 1.0, 2.0]
+
+
+def test_alpha_run_default_universe_index():
+    """Test that the default universe's index is built once and survives universe edits."""
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = constant_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    signals_df = alpha.run(cache = False)
+    assert signals_df.index.equals(alpha._universe_index)
+    
+    # Renaming the result's index mustn't touch the prebuilt one
+    signals_df.index.name = "ticker"
+    assert alpha._universe_index.name == "asset"
+    
+    # Changing the universe in place should still give the right tickers
+    alpha.universe.append("MSFT")
+    signals_df = alpha.run(cache = False)
+    assert signals_df.index.tolist() == ["AAPL", "GOOGL", "MSFT"]
+
+
+def test_alpha_validate_universe():
+    """Test that validate_universe accepts normal tickers and rejects junk."""
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = constant_signal_fn,
+        universe = ["AAPL", "BRK.B", "BTC-USD"],
+        validate_universe = True
+    )
+    assert alpha.universe == ["AAPL", "BRK.B", "BTC-USD"]
+    
+    with pytest.raises(ValueError, match="Invalid tickers"):
+        Alpha(
+            name = "test_alpha",
+            signal_fn = constant_signal_fn,
+            universe = ["AAPL", "aapl", "", "WAY_TOO_LONG_TICKER", "BTC/USD"],
+            validate_universe = True
+        )
+    
+    # set_universe() keeps checking once validation is on
+    with pytest.raises(ValueError, match="Invalid tickers"):
+        alpha.set_universe(["AAPL", "bad ticker"])
+    assert alpha.universe == ["AAPL", "BRK.B", "BTC-USD"]
+    
+    # Off by default, so nothing changes for existing code
+    Alpha(name = "test_alpha", signal_fn = constant_signal_fn, universe = ["aapl"])
+
+
+def test_alpha_metadata_cached():
+    """Test that metadata() is read-only and refreshed when the universe changes."""
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = constant_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    
+    metadata = alpha.metadata()
+    assert alpha.metadata() == metadata
+    with pytest.raises(TypeError):
+        metadata["name"] = "something_else"
+    
+    # Editing the universe in place still shows up
+    alpha.universe.append("MSFT")
+    assert alpha.metadata()["universe_size"] == 3
+    
+    # And so does swapping it out through set_universe()
+    alpha.set_universe([])
+    assert alpha.metadata()["universe_size"] == 0
+    assert alpha.metadata()["has_universe"] is False
+    assert alpha._universe_index is None
+    
+    # None means empty, same as in __init__
+    alpha.set_universe(["AAPL"])
+    alpha.set_universe(None)
+    assert alpha.universe == []
+    assert alpha.metadata()["universe_size"] == 0
+    
+    # A universe that can't be turned into a tuple leaves everything as it was
+    alpha.set_universe(["AAPL", "GOOGL"])
+    with pytest.raises(TypeError):
+        alpha.set_universe(42)
+    assert alpha.universe == ["AAPL", "GOOGL"]
+    assert alpha.metadata()["universe_size"] == 2
+    assert alpha.run()["signal"].tolist() == [1.0, 1.0]
+
+
+def test_alpha_run_stateful_signal_fn_not_cached():
+    """Test that callable objects (which can change state) aren't cached, even unhashable ones."""
+    @dataclass
+    class ScaledSignal:
+        scale: float
+        
+        def __call__(self, universe):
+            return {asset: self.scale for asset in universe}
+    
+    signal_fn = ScaledSignal(scale = 1.0)
+    with pytest.raises(TypeError):
+        hash(signal_fn)
+    
+    alpha = Alpha(name = "test_alpha", signal_fn = signal_fn, universe = ["AAPL"])
+    for scale in (1.0, 2.0, 3.0):
+        signal_fn.scale = scale
+        assert alpha.run().loc["AAPL", "signal"] == scale
+
+
+def test_alpha_copy_gets_own_caches():
+    """Test that copy.copy gives the copy its own caches."""
+    import copy
+    
+    alpha = Alpha(name = "test_alpha", signal_fn = constant_signal_fn, universe = ["AAPL"])
+    alpha.run()
+    
+    clone = copy.copy(alpha)
+    assert clone._cache is not alpha._cache
+    assert clone._index_cache is not alpha._index_cache
+    assert len(clone._cache) == 0
+    assert clone.name == alpha.name and clone.universe is alpha.universe
+    assert clone.run()["signal"].tolist() == [1.0]
+    assert clone.metadata() == alpha.metadata()
+
+
+def test_alpha_pickle_round_trip():
+    """Test that an Alpha survives pickling and deepcopy (needed for process pools)."""
+    import copy
+    import pickle
+    
+    alpha = Alpha(
+        name = "test_alpha",
+        signal_fn = constant_signal_fn,
+        universe = ["AAPL", "GOOGL"]
+    )
+    alpha.metadata()
+    
+    for clone in (pickle.loads(pickle.dumps(alpha)), copy.deepcopy(alpha)):
+        assert clone.name == "test_alpha"
+        assert clone.universe == ["AAPL", "GOOGL"]
+        assert clone.metadata() == alpha.metadata()
+        assert clone.run()["signal"].tolist() == [1.0, 1.0]
+
+
+def test_alpha_run_array_length_mismatch():
+    """Test that array results must have exactly one value per asset."""
+    import numpy as np
+    from alphalab import returns_ndarray
+    
+    @returns_ndarray
+    def short_signal_fn(universe):
+        return np.ones(len(universe) - 1)
+    
+    @returns_ndarray
+    def scalar_signal_fn(universe):
+        return 3.0
+    
+    for signal_fn in (short_signal_fn, scalar_signal_fn, lambda universe: np.array([7.0])):
+        alpha = Alpha(name = "test_alpha", signal_fn = signal_fn, universe = ["AAPL", "GOOGL"])
+        with pytest.raises(ValueError, match="values for 2 assets"):
+            alpha.run()
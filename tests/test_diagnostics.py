@@ -3,7 +3,12 @@
 import pytest
 import pandas as pd
 import numpy as np
-from alphalab.diagnostics import information_coefficient, sharpe_ratio
+from alphalab.diagnostics import (
+    information_coefficient,
+    information_coefficient_batch,
+    sharpe_ratio,
+    sharpe_ratio_batch,
+)
 
 
 def test_sharpe_ratio_basic():
@@ -49,3 +54,185 @@ def test_sharpe_ratio_numpy_array():
     assert isinstance(sharpe, float)
     assert sharpe > 0
 
+
+
+def test_information_coefficient_matches_pandas():
+    """Test that information_coefficient gives the same answer as pandas corr."""
+    signals = np.array([0.1, -0.2, 0.3, -0.1, 0.05])
+    returns = np.array([0.08, -0.15, 0.28, -0.05, 0.01])
+    ic = information_coefficient(signals, returns)
+    
+    assert isinstance(ic, float)
+    assert ic == pytest.approx(pd.Series(signals).corr(pd.Series(returns)))
+
+
+def test_information_coefficient_skips_nans():
+    """Test that NaN pairs get dropped instead of poisoning the result."""
+    signals = pd.Series([0.1, np.nan, 0.3, -0.1, 0.2])
+    returns = pd.Series([0.08, -0.15, np.nan, -0.05, 0.1])
+    ic = information_coefficient(signals, returns)
+    
+    assert ic == pytest.approx(signals.corr(returns))
+
+
+def test_information_coefficient_aligns_series_by_index():
+    """Test that two Series get matched by ticker, not by position."""
+    signals = pd.Series({"AAPL": 0.3, "MSFT": -0.1, "GOOGL": 0.2, "TSLA": -0.4})
+    returns = pd.Series({"TSLA": -0.05, "GOOGL": 0.02, "AAPL": 0.04, "MSFT": -0.01})
+    ic = information_coefficient(signals, returns)
+    
+    assert ic == pytest.approx(signals.corr(returns))
+    assert ic > 0.9
+
+
+def test_information_coefficient_constant_signals():
+    """Test that constant signals give 0.0 instead of NaN."""
+    signals = np.array([0.1, 0.1, 0.1, 0.1])
+    returns = np.array([0.01, -0.02, 0.03, 0.0])
+    
+    assert information_coefficient(signals, returns) == 0.0
+
+
+def test_information_coefficient_length_mismatch():
+    """Test that mismatched lengths raise a ValueError."""
+    with pytest.raises(ValueError, match="same length"):
+        information_coefficient(np.array([0.1, 0.2]), np.array([0.1]))
+
+
+def test_information_coefficient_numpy_fallback():
+    """Test that the NumPy fallback agrees with whichever kernel is in use."""
+    from alphalab.diagnostics import ic
+    
+    rng = np.random.default_rng(3)
+    signals = rng.standard_normal(500) + 100.0  # big offset to check for cancellation
+    returns = 0.3 * signals + rng.standard_normal(500)
+    signals[[10, 20]] = np.nan
+    returns[30] = np.inf
+    
+    expected = ic._pearson_corr_numpy(signals, returns)
+    assert information_coefficient(signals, returns) == pytest.approx(expected, abs = 1e-12)
+
+
+def test_information_coefficient_long_inputs():
+    """Test that long inputs (which take the vectorized path) match the NumPy fallback."""
+    from alphalab.diagnostics import ic
+    
+    rng = np.random.default_rng(4)
+    signals = rng.standard_normal(5000)
+    returns = 0.1 * signals + rng.standard_normal(5000)
+    expected = ic._pearson_corr_numpy(signals, returns)
+    
+    assert information_coefficient(signals, returns) == pytest.approx(expected, abs = 1e-12)
+    
+    # A NaN anywhere should still be skipped, not propagated
+    signals[100] = np.nan
+    expected = ic._pearson_corr_numpy(signals, returns)
+    assert information_coefficient(signals, returns) == pytest.approx(expected, abs = 1e-12)
+
+
+def test_information_coefficient_batch_matches_single():
+    """Test that the batch version agrees with calling information_coefficient per column."""
+    rng = np.random.default_rng(0)
+    signals = rng.standard_normal((100, 5))
+    returns = rng.standard_normal(100)
+    signals[:, 3] = 1.0  # constant column should come back as 0.0
+    
+    ics = information_coefficient_batch(signals, returns)
+    expected = [information_coefficient(signals[:, j], returns) for j in range(5)]
+    
+    assert ics.shape == (5,)
+    assert ics[3] == 0.0
+    np.testing.assert_allclose(ics, expected, atol = 1e-12)
+
+
+def test_information_coefficient_batch_numpy_fallback():
+    """Test that the NumPy fallback gives the same answer as the numba kernel."""
+    from alphalab.diagnostics import ic
+    
+    rng = np.random.default_rng(1)
+    signals = rng.standard_normal((50, 4))
+    returns = rng.standard_normal(50)
+    expected = [information_coefficient(signals[:, j], returns) for j in range(4)]
+    
+    np.testing.assert_allclose(ic._ic_batch_numpy(signals, returns), expected, atol = 1e-12)
+
+
+def test_information_coefficient_batch_skips_nans():
+    """Test that NaNs in the batch version get skipped the same way as in the single version."""
+    rng = np.random.default_rng(5)
+    signals = rng.standard_normal((80, 3))
+    returns = 0.5 * signals[:, 0] + rng.standard_normal(80)
+    returns[7] = np.nan  # drops row 7 for every column
+    signals[12, 1] = np.nan  # only affects column 1
+    
+    ics = information_coefficient_batch(signals, returns)
+    expected = [information_coefficient(signals[:, j], returns) for j in range(3)]
+    
+    assert np.isfinite(ics).all()
+    np.testing.assert_allclose(ics, expected, atol = 1e-12)
+
+
+def test_information_coefficient_batch_shape_mismatch():
+    """Test that the batch version rejects returns with the wrong number of rows."""
+    with pytest.raises(ValueError, match="same length"):
+        information_coefficient_batch(np.zeros((10, 2)), np.zeros(9))
+
+
+def test_sharpe_ratio_matches_pandas():
+    """Test that sharpe_ratio agrees with the textbook pandas mean/std formula."""
+    returns = pd.Series([0.01, 0.02, -0.01, 0.015, 0.01, np.nan, -0.005])
+    expected = (returns.mean() - 0.02 / 252) / returns.std() * np.sqrt(252)
+    
+    assert sharpe_ratio(returns, risk_free_rate = 0.02) == pytest.approx(expected)
+
+
+def test_sharpe_ratio_batch_matches_single():
+    """Test that sharpe_ratio_batch agrees with calling sharpe_ratio per column."""
+    rng = np.random.default_rng(2)
+    returns = rng.standard_normal((60, 4)) * 0.01
+    returns[:, 2] = 0.01  # no volatility, should come back as 0.0
+    returns[5, 1] = np.nan  # missing values get skipped like in sharpe_ratio
+    returns[:, 3] = 1.0 + 1e-6 * rng.standard_normal(60)  # big offset, tiny noise
+    
+    sharpes = sharpe_ratio_batch(returns, risk_free_rate = 0.02, periods_per_year = 252)
+    expected = [sharpe_ratio(returns[:, j], risk_free_rate = 0.02) for j in range(4)]
+    
+    assert sharpes.shape == (4,)
+    assert sharpes[2] == 0.0
+    np.testing.assert_allclose(sharpes, expected)
+    
+    # The offset column should still agree with pandas' own mean/std
+    offset = pd.Series(returns[:, 3])
+    expected_offset = (offset.mean() - 0.02 / 252) / offset.std() * np.sqrt(252)
+    assert sharpes[3] == pytest.approx(expected_offset, rel = 1e-9)
+    assert sharpe_ratio(returns[:, 3], risk_free_rate = 0.02) == pytest.approx(expected_offset, rel = 1e-9)
+
+
+def test_sharpe_ratio_batch_requires_2d():
+    """Test that sharpe_ratio_batch rejects 1D input."""
+    with pytest.raises(ValueError, match="2D"):
+        sharpe_ratio_batch(np.array([0.01, 0.02]))
+
+
+def test_diagnostics_import_skips_pandas_and_numba():
+    """Test that importing diagnostics on its own doesn't drag in pandas or numba."""
+    import os
+    import subprocess
+    import sys
+    
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    code = (
+        "import sys, numpy as np\n"
+        "from alphalab.diagnostics import sharpe_ratio\n"
+        "sharpe_ratio(np.array([0.01, 0.02, -0.01]))\n"
+        "print('pandas' in sys.modules, 'numba' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env = {**os.environ, "PYTHONPATH": src_dir},
+        capture_output = True,
+        text = True,
+        check = True
+    )
+    
+    assert result.stdout.split() == ["False", "False"]